@@ -8,13 +8,35 @@ __version__ = "0.1.0"
 __author__ = "1084 Ventures"
 __email__ = "info@1084ventures.com"
 
-# Import all models for easy access
-from .models import Brand, Post, PostPlan, SocialAccount
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+from typing import Any as _Any
 
-# Make submodules available
-from . import models
-from . import schemas
-from . import openapi
+if _TYPE_CHECKING:
+    from .models import Brand, Post, PostPlan, SocialAccount
+    from . import models
+    from . import schemas
+    from . import openapi
+
+# Models and submodules are imported on first attribute access (PEP 562), so
+# loading a schema doesn't pay for importing pydantic or PyYAML
+_SUBMODULES = {"models", "schemas", "openapi"}
+_MODEL_NAMES = {"Brand", "Post", "PostPlan", "SocialAccount"}
+
+def __getattr__(name: str) -> _Any:
+    if name in _SUBMODULES:
+        value = _importlib.import_module(f".{name}", __name__)
+    elif name in _MODEL_NAMES:
+        value = getattr(_importlib.import_module(".models", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    # Public names plus module metadata, not the private lazy-loading helpers
+    dunders = {name for name in globals() if name.startswith("__") and name.endswith("__")}
+    return sorted(dunders | set(__all__))
 
 __all__ = [
     # Version info
@@ -2,14 +2,34 @@
 OpenAPI specifications for AutoGenSocial platform services.
 """
 
+from __future__ import annotations
+
+import copy
 import os
 from pathlib import Path
-from typing import Dict, Any
-import yaml
+from typing import Dict, Any, Optional, Tuple
+
+# Use orjson when installed; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
 
 # Get the directory containing this file
 _current_dir = Path(__file__).parent
 
+# Spec file extensions, in lookup order; JSON parses much faster than YAML
+_SPEC_SUFFIXES = ('.json', '.yaml', '.yml')
+
+# Parsed YAML specs keyed by file path, tagged with the (mtime_ns, size) they were
+# read at. Loads hand out deep copies, which is far cheaper than re-parsing YAML,
+# so callers always get a dictionary of their own. JSON specs parse faster than
+# they could be copied and are not cached.
+_yaml_spec_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Names found by the first directory scan; the packaged files don't change at runtime
+_available_specs: Optional[Tuple[str, ...]] = None
+
 def load_openapi_spec(service_name: str) -> Dict[str, Any]:
     """Load an OpenAPI specification by service name.
     
@@ -21,29 +41,66 @@ def load_openapi_spec(service_name: str) -> Dict[str, Any]:
         
     Raises:
         FileNotFoundError: If the specification file doesn't exist
+        json.JSONDecodeError: If the JSON file is invalid
         yaml.YAMLError: If the YAML file is invalid
     """
-    spec_file = _current_dir / f"{service_name}.yaml"
-    if not spec_file.exists():
-        raise FileNotFoundError(f"OpenAPI specification not found: {spec_file}")
+    for suffix in _SPEC_SUFFIXES:
+        spec_file = _current_dir / f"{service_name}{suffix}"
+        try:
+            stat = spec_file.stat()
+            break
+        except FileNotFoundError:
+            continue
+    else:
+        raise FileNotFoundError(
+            f"OpenAPI specification not found: {_current_dir / service_name}"
+            f".{{{','.join(s[1:] for s in _SPEC_SUFFIXES)}}}"
+        )
+    
+    if spec_file.suffix == '.json':
+        return _json_loads(spec_file.read_bytes())
     
-    with open(spec_file, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached_yaml = _yaml_spec_cache.get(spec_file)
+    if cached_yaml is not None and cached_yaml[0] == key:
+        return copy.deepcopy(cached_yaml[1])
+    
+    # Imported here so listing specs doesn't require PyYAML
+    import yaml
+    
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(spec_file, 'rb') as f:
+        spec = yaml.load(f, Loader=loader)
+    _yaml_spec_cache[spec_file] = (key, spec)
+    return copy.deepcopy(spec)
+
+def clear_cache() -> None:
+    """Drop all cached YAML specifications and the cached list of available specs."""
+    global _available_specs
+    _yaml_spec_cache.clear()
+    _available_specs = None
 
 def get_available_specs() -> list[str]:
     """Get list of available OpenAPI specification files.
     
+    The directory is scanned on first use; call clear_cache() to rescan it.
+    
     Returns:
         List of service names that have OpenAPI specifications
     """
-    yaml_files = _current_dir.glob("*.yaml")
-    yml_files = _current_dir.glob("*.yml")
-    
-    specs = []
-    for file_path in list(yaml_files) + list(yml_files):
-        specs.append(file_path.stem)
+    global _available_specs
+    if _available_specs is None:
+        with os.scandir(_current_dir) as entries:
+            specs = [
+                entry.name.rsplit('.', 1)[0]
+                for entry in entries
+                if entry.name.endswith(_SPEC_SUFFIXES) and entry.is_file()
+            ]
+        # A service may ship the same spec in more than one format
+        _available_specs = tuple(sorted(set(specs)))
     
-    return sorted(specs)
+    return list(_available_specs)
 
 # Pre-defined service names for easy access
 CONTENT_API = "content-api"
@@ -53,6 +110,7 @@ PUBLISHER = "publisher"
 __all__ = [
     "load_openapi_spec",
     "get_available_specs",
+    "clear_cache",
     "CONTENT_API",
     "IMAGE_COMPOSER", 
     "PUBLISHER",
@@ -2,14 +2,24 @@
 JSON schemas for AutoGenSocial platform data models.
 """
 
-import json
+from __future__ import annotations
+
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+# Use orjson when installed; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
 
 # Get the directory containing this file
 _current_dir = Path(__file__).parent
 
+# Names found by the first directory scan; the packaged files don't change at runtime
+_available_schemas: Optional[Tuple[str, ...]] = None
+
 def load_schema(schema_name: str) -> Dict[str, Any]:
     """Load a JSON schema by name.
     
@@ -28,26 +38,37 @@ def load_schema(schema_name: str) -> Dict[str, Any]:
         schema_name = schema_name[:-5]
     
     schema_file = _current_dir / f"{schema_name}.json"
-    if not schema_file.exists():
-        raise FileNotFoundError(f"Schema not found: {schema_file}")
+    try:
+        data = schema_file.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Schema not found: {schema_file}") from None
     
-    with open(schema_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return _json_loads(data)
+
+def clear_cache() -> None:
+    """Drop the cached list of available schemas."""
+    global _available_schemas
+    _available_schemas = None
 
 def get_available_schemas() -> list[str]:
     """Get list of available schema files.
     
+    The directory is scanned on first use; call clear_cache() to rescan it.
+    
     Returns:
         List of schema names that are available
     """
-    json_files = _current_dir.glob("*.json")
-    
-    schemas = []
-    for file_path in json_files:
-        if file_path.name != "__init__.py":  # Exclude any __init__.py files
-            schemas.append(file_path.stem)
+    global _available_schemas
+    if _available_schemas is None:
+        with os.scandir(_current_dir) as entries:
+            schemas = [
+                entry.name[:-5]
+                for entry in entries
+                if entry.name.endswith('.json') and entry.is_file()
+            ]
+        _available_schemas = tuple(sorted(schemas))
     
-    return sorted(schemas)
+    return list(_available_schemas)
 
 # Pre-defined schema names for easy access
 BRAND = "brand"
@@ -58,6 +79,7 @@ SOCIAL_ACCOUNT = "socialAccount"
 __all__ = [
     "load_schema",
     "get_available_schemas",
+    "clear_cache",
     "BRAND",
     "POST",
     "POST_PLAN",
@@ -8,11 +8,17 @@ This script uses `datamodel-code-generator`.
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import importlib.metadata
+import importlib.util
+import io
+import json
 import os
-import subprocess
-import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 # --- Configuration ---
 # Get the directory containing this script
@@ -25,69 +31,163 @@ INPUT_DIR = ROOT_DIR / "autogensocial_contracts" / "schemas"
 OUTPUT_DIR = ROOT_DIR / "autogensocial_contracts" / "models"
 # Target Python version for generated code
 TARGET_PYTHON_VERSION = "3.13"
+# Model base class for generated code
+OUTPUT_MODEL_TYPE = "pydantic_v2.BaseModel"
+# Omit the generation timestamp so unchanged schemas produce identical files
+DISABLE_TIMESTAMP = True
+# Schemas each worker process must get before a pool beats one in-process loop;
+# a worker's first generate() costs roughly as much as eight more schemas
+SCHEMAS_PER_WORKER = 8
+# Records the schema hashes the current models were generated from
+MANIFEST_FILE = OUTPUT_DIR / ".codegen-cache.json"
 # --- End Configuration ---
 
 
-def build_commands() -> List[List[str]]:
-    """Builds the datamodel-codegen commands for each schema file."""
-    json_files = [f for f in INPUT_DIR.glob("*.json") if f.is_file()]
+def find_schema_files() -> List[Path]:
+    """Finds the JSON schema files to generate models from."""
+    json_files = sorted(f for f in INPUT_DIR.glob("*.json") if f.is_file())
     
     if not json_files:
         raise ValueError(f"No JSON schema files found in {INPUT_DIR}")
     
-    commands = []
-    for json_file in json_files:
-        output_file = OUTPUT_DIR / f"{json_file.stem}.py"
-        cmd = [
-            "datamodel-codegen",
-            "--input",
-            str(json_file),
-            "--input-file-type",
-            "jsonschema",
-            "--output",
-            str(output_file),
-            "--target-python-version",
-            TARGET_PYTHON_VERSION,
-            "--disable-timestamp",
-            "--output-model-type",
-            "pydantic_v2.BaseModel",
-        ]
-        commands.append(cmd)
+    return json_files
+
+
+def find_file_refs(schema: Any, base_dir: Path) -> Set[Path]:
+    """Returns the files referenced by relative `$ref`s anywhere in a parsed schema."""
+    refs = set()
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                target = ref.split("#", 1)[0]
+                if target and "://" not in target:
+                    refs.add((base_dir / target).resolve())
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return refs
+
+
+def hash_schema(json_file: Path) -> str:
+    """Returns a SHA-256 hex digest covering a schema and every file it references.
     
-    return commands
+    Referenced models are inlined into the generated module, so a change to any
+    file reachable through `$ref` must invalidate this schema's model too.
+    """
+    digest = hashlib.sha256()
+    seen: Set[Path] = set()
+    pending = [json_file.resolve()]
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            # Let the generator report the broken reference; hash it as missing
+            data = b""
+        else:
+            try:
+                pending.extend(find_file_refs(json.loads(data), path.parent))
+            except ValueError:
+                pass  # Invalid JSON; the generator reports it
+        
+        digest.update(os.path.relpath(path, INPUT_DIR).encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256(data).digest())
+    
+    return digest.hexdigest()
+
 
+def generator_settings(generator_version: str) -> Dict[str, Any]:
+    """Returns every setting besides the schemas that affects generated output."""
+    return {
+        "generator_version": generator_version,
+        "target_python_version": TARGET_PYTHON_VERSION,
+        "output_model_type": OUTPUT_MODEL_TYPE,
+        "disable_timestamp": DISABLE_TIMESTAMP,
+    }
 
-def run(cmd: List[str]) -> int:
-    """Executes the command."""
-    print("Generated command:")
-    print(" ".join(cmd))
 
+def load_manifest(generator_version: str) -> Dict[str, str]:
+    """Loads the schema hashes from the last run, if it used the same settings."""
     try:
-        proc = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        print("\nSuccess! Models generated in:", OUTPUT_DIR)
-        if proc.stdout:
-            print("Output:\n", proc.stdout)
-        return 0
-    except FileNotFoundError:
-        print("\nError: 'datamodel-codegen' not found on PATH.")
-        print("Please install it: pip install datamodel-code-generator")
-        return 1
-    except subprocess.CalledProcessError as e:
-        print(f"\nError executing command. Return code: {e.returncode}")
-        if e.stdout:
-            print("STDOUT:", e.stdout)
-        if e.stderr:
-            print("STDERR:", e.stderr)
-        return e.returncode
+        manifest: Dict[str, Any] = json.loads(MANIFEST_FILE.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    
+    if manifest.get("settings") != generator_settings(generator_version):
+        return {}
+    
+    return dict(manifest.get("schemas", {}))
+
 
+def save_manifest(generator_version: str, schema_hashes: Dict[str, str]) -> None:
+    """Writes the schema hashes the current models were generated from."""
+    manifest = {
+        "settings": generator_settings(generator_version),
+        "schemas": dict(sorted(schema_hashes.items())),
+    }
+    MANIFEST_FILE.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
 
-def main() -> int:
+
+def generate_model(json_file: Path) -> Tuple[int, str]:
+    """Generates the model for one schema, returning an exit code and buffered log output."""
+    from datamodel_code_generator import (
+        DataModelType,
+        InputFileType,
+        PythonVersion,
+        generate,
+    )
+
+    output_file = OUTPUT_DIR / f"{json_file.stem}.py"
+    log = io.StringIO()
+    print(f"Generating {output_file.name} from {json_file.name}", file=log)
+
+    try:
+        generate(
+            json_file,
+            input_file_type=InputFileType.JsonSchema,
+            output=output_file,
+            target_python_version=PythonVersion(TARGET_PYTHON_VERSION),
+            disable_timestamp=DISABLE_TIMESTAMP,
+            output_model_type=DataModelType(OUTPUT_MODEL_TYPE),
+        )
+    except Exception:
+        print("\nError generating model:", file=log)
+        print(traceback.format_exc(), file=log)
+        return 1, log.getvalue()
+
+    print("Success! Model written to:", output_file, file=log)
+    return 0, log.getvalue()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main function to generate models."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate every model, even if its schemas are unchanged",
+    )
+    args = parser.parse_args(argv)
+    
     # Ensure input directory exists
     if not INPUT_DIR.exists():
         print(f"Error: Input directory '{INPUT_DIR}' does not exist.")
         return 1
     
+    # generate_model imports the library itself; check it exists without importing it
+    if importlib.util.find_spec("datamodel_code_generator") is None:
+        print("Error: 'datamodel-code-generator' is not installed.")
+        print("Please install it: pip install datamodel-code-generator")
+        return 1
+    generator_version = importlib.metadata.version("datamodel-code-generator")
+    
     # Create output directory if it doesn't exist
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
@@ -96,35 +196,55 @@ def main() -> int:
     os.chdir(ROOT_DIR)
     
     try:
-        # Remove existing generated files (except __init__.py) to avoid conflicts
+        json_files = find_schema_files()
+        schema_hashes = {f.stem: hash_schema(f) for f in json_files}
+        previous_hashes = {} if args.force else load_manifest(generator_version)
+        
+        # Remove generated files whose schema no longer exists
         for existing_file in OUTPUT_DIR.glob("*.py"):
-            if existing_file.name != "__init__.py":
+            if existing_file.name != "__init__.py" and existing_file.stem not in schema_hashes:
                 existing_file.unlink()
         
-        commands = build_commands()
+        # Only regenerate models whose schema (or anything it references) changed,
+        # or whose output is missing
+        stale_files = [
+            f
+            for f in json_files
+            if previous_hashes.get(f.stem) != schema_hashes[f.stem]
+            or not (OUTPUT_DIR / f"{f.stem}.py").exists()
+        ]
+        if not stale_files:
+            save_manifest(generator_version, schema_hashes)
+            print(f"All {len(json_files)} models are up to date in: {OUTPUT_DIR}")
+            return 0
+        
+        # The first generate() in a process pays for datamodel-code-generator's
+        # lazy imports, so only fan out when every worker gets enough schemas
+        # to make that start-up cost worthwhile
+        print(f"Generating {len(stale_files)} of {len(json_files)} models...")
+        max_workers = min(os.cpu_count() or 1, len(stale_files) // SCHEMAS_PER_WORKER)
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(generate_model, stale_files))
+        else:
+            results = [generate_model(f) for f in stale_files]
         
-        # Check if datamodel-codegen is available
-        try:
-            subprocess.run(["datamodel-codegen", "--version"], check=True, capture_output=True)
-            use_module = False
-        except FileNotFoundError:
-            print("datamodel-codegen not found on PATH; trying with 'python -m'.")
-            if not sys.executable:
-                print("Could not find python executable.")
-                return 1
-            use_module = True
+        failures = 0
+        for i, (json_file, (returncode, log)) in enumerate(zip(stale_files, results)):
+            print(f"Model {i+1}/{len(stale_files)}:")
+            print(log, end="")
+            if returncode != 0:
+                failures += 1
+                # Make sure the next run retries this schema
+                del schema_hashes[json_file.stem]
+        
+        save_manifest(generator_version, schema_hashes)
         
-        # Execute each command
-        for i, command in enumerate(commands):
-            if use_module:
-                command = [sys.executable, "-m", "datamodel_code_generator.cli"] + command[1:]
-            
-            print(f"Generating model {i+1}/{len(commands)}...")
-            result = run(command)
-            if result != 0:
-                return result
+        if failures:
+            print(f"\nFailed to generate {failures} of {len(stale_files)} model files.")
+            return 1
         
-        print(f"\nSuccessfully generated {len(commands)} model files in: {OUTPUT_DIR}")
+        print(f"\nSuccessfully generated {len(stale_files)} model files in: {OUTPUT_DIR}")
         return 0
         
     finally: